@@ -0,0 +1,76 @@
+"""Accuracy/speed of spatially culled illuminance and nearest-fixture queries vs brute force.
+
+Usage:
+    python benchmark_spatial.py --length 120 --width 80 --spacing 0.5
+"""
+import argparse
+import time
+
+import numpy as np
+
+from utils.calculations import (
+    calculate_fixture_positions,
+    calculate_point_illuminance,
+    calculate_cutoff_radius,
+    find_nearest_fixtures
+)
+from utils.constants import ROOM_ILLUMINANCE, WORK_PLANE_HEIGHT
+
+TOLERANCES = (1e-2, 1e-3, 1e-4, 1e-5)
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=float, default=120.0, help="floor length (m)")
+    parser.add_argument("--width", type=float, default=80.0, help="floor width (m)")
+    parser.add_argument("--height", type=float, default=3.0, help="ceiling height (m)")
+    parser.add_argument("--spacing", type=float, default=0.5, help="calculation grid spacing (m)")
+    parser.add_argument("--fixture", default="LED Bulb", help="fixture type")
+    args = parser.parse_args()
+
+    required_lumens = args.length * args.width * ROOM_ILLUMINANCE["Home Office"]
+    fixture_positions = calculate_fixture_positions(
+        args.length, args.width, args.height, args.fixture, required_lumens
+    )
+
+    x, y = np.meshgrid(
+        np.arange(args.spacing / 2, args.length, args.spacing),
+        np.arange(args.spacing / 2, args.width, args.spacing)
+    )
+    points = np.column_stack([x.ravel(), y.ravel()])
+    print(f"{len(fixture_positions)} fixtures, {len(points)} grid points")
+
+    exact, brute_time = _timed(calculate_point_illuminance, points, fixture_positions, args.fixture)
+    print(f"brute force illuminance: {brute_time:.2f}s, mean {exact.mean():.0f} lux")
+
+    mounting_height = args.height - WORK_PLANE_HEIGHT
+    print(f"{'tolerance':>10}{'cutoff (m)':>12}{'time (s)':>10}{'speedup':>9}"
+          f"{'max err %':>11}{'mean err %':>12}")
+    for tolerance in TOLERANCES:
+        culled, culled_time = _timed(
+            calculate_point_illuminance, points, fixture_positions, args.fixture, tolerance=tolerance
+        )
+        error = (exact - culled) / exact * 100
+        print(f"{tolerance:>10.0e}{calculate_cutoff_radius(mounting_height, tolerance):>12.1f}"
+              f"{culled_time:>10.2f}{brute_time / culled_time:>9.1f}"
+              f"{error.max():>11.3f}{error.mean():>12.3f}")
+
+    # Nearest fixture: brute force over all fixtures vs the hash grid
+    fixtures = np.array([[pos["x"], pos["y"]] for pos in fixture_positions])
+    sample = points[::max(1, len(points) // 20000)]
+    start = time.perf_counter()
+    brute_nearest = np.array([np.argmin(np.hypot(*(fixtures - point).T)) for point in sample])
+    nearest_brute_time = time.perf_counter() - start
+    (grid_nearest, _), nearest_grid_time = _timed(find_nearest_fixtures, sample, fixture_positions)
+
+    brute_distance = np.hypot(*(fixtures[brute_nearest] - sample).T)
+    grid_distance = np.hypot(*(fixtures[grid_nearest] - sample).T)
+    print(f"nearest fixture ({len(sample)} points): brute force {nearest_brute_time:.2f}s, "
+          f"grid {nearest_grid_time:.2f}s, distance mismatches {np.sum(~np.isclose(brute_distance, grid_distance))}")
+
+if __name__ == "__main__":
+    main()
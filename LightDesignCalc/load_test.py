@@ -0,0 +1,119 @@
+"""Local load test: N simulated sessions computing the illuminance map inline vs on the compute pool.
+
+Usage:
+    python load_test.py --sessions 8 --runs 5
+
+Reports map latency and how long each session's UI thread is held up. The pool only
+shortens map latency when there are spare cores; with a single core it is slower (every
+job pays the process round trip) and only the UI delay improves.
+"""
+import argparse
+import os
+import statistics
+import threading
+import time
+
+from utils.calculations import calculate_lighting_plan, calculate_illuminance_grid
+from utils.compute_pool import ComputePool, MAX_WORKERS
+
+# Largest room the calculator accepts; its illuminance map (~5M point-fixture pairs) goes to the pool
+ROOM_INPUTS = {
+    "length": 20.0,
+    "width": 20.0,
+    "height": 3.0,
+    "room_type": "Kitchen",
+    "wall_color": "#FFFFFF",
+    "ceiling_color": "#FFFFFF",
+    "preferred_fixture": "LED Bulb",
+    "mounting_type": "Ceiling Mounted",
+    "num_windows": 10,
+    "window_width": 2.0,
+    "window_height": 1.5,
+    "orientation": "South"
+}
+
+UI_TICK = 0.05  # seconds between simulated widget interactions
+
+def _session(run_map, map_args, runs, latencies, ui_delays, stop):
+    """One simulated session: a script thread computing maps and a UI thread ticking alongside."""
+    def ui_loop():
+        # Oversleep of a short sleep measures how long the GIL keeps this session's UI waiting
+        while not stop.is_set():
+            start = time.perf_counter()
+            time.sleep(UI_TICK)
+            ui_delays.append(time.perf_counter() - start - UI_TICK)
+
+    ui_thread = threading.Thread(target=ui_loop)
+    ui_thread.start()
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_map(*map_args)
+        latencies.append(time.perf_counter() - start)
+    return ui_thread
+
+def run_load_test(mode, map_args, sessions, runs, pool=None):
+    """Run all sessions concurrently and collect map latency and UI delay samples."""
+    if mode == "pool":
+        run_map = lambda *args: pool.submit(calculate_illuminance_grid, *args, timeout=None).result()
+    else:
+        run_map = calculate_illuminance_grid
+
+    latencies, ui_delays = [], []
+    stop = threading.Event()
+    ui_threads = []
+    ui_lock = threading.Lock()
+
+    def worker():
+        ui_thread = _session(run_map, map_args, runs, latencies, ui_delays, stop)
+        with ui_lock:
+            ui_threads.append(ui_thread)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - start
+
+    stop.set()
+    for ui_thread in ui_threads:
+        ui_thread.join()
+
+    return {
+        "wall_time": wall_time,
+        "p50_latency": statistics.median(latencies),
+        "p95_latency": statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0],
+        "p95_ui_delay": statistics.quantiles(ui_delays, n=20)[-1] if len(ui_delays) > 1 else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8, help="number of simulated sessions")
+    parser.add_argument("--runs", type=int, default=5, help="maps calculated per session")
+    parser.add_argument("--length", type=float, default=ROOM_INPUTS["length"], help="floor length (m)")
+    parser.add_argument("--width", type=float, default=ROOM_INPUTS["width"], help="floor width (m)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="compute pool workers")
+    args = parser.parse_args()
+
+    inputs = dict(ROOM_INPUTS, length=args.length, width=args.width)
+    plan = calculate_lighting_plan(inputs)
+    map_args = (args.length, args.width, plan["fixture_positions"], inputs["preferred_fixture"])
+
+    pool = ComputePool(max_workers=args.workers, max_pending=args.workers * 2)
+    # Warm the workers up so process start-up is not counted against the pool
+    pool.submit(calculate_illuminance_grid, *map_args, timeout=None).result()
+
+    print(f"{args.sessions} sessions x {args.runs} maps on {args.length:g} x {args.width:g} m "
+          f"({len(plan['fixture_positions'])} fixtures), "
+          f"{args.workers} pool workers, {os.cpu_count()} CPUs")
+    print(f"{'mode':<8}{'wall (s)':>10}{'p50 (s)':>10}{'p95 (s)':>10}{'p95 UI delay (ms)':>20}")
+    for mode in ("inline", "pool"):
+        result = run_load_test(mode, map_args, args.sessions, args.runs, pool)
+        print(f"{mode:<8}{result['wall_time']:>10.2f}{result['p50_latency']:>10.3f}"
+              f"{result['p95_latency']:>10.3f}{result['p95_ui_delay'] * 1000:>20.1f}")
+
+    pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,18 @@
 import numpy as np
-from .constants import COLOR_REFLECTANCE_RANGES, ORIENTATION_FACTORS, FIXTURE_TYPES
+from .constants import (
+    COLOR_REFLECTANCE_RANGES,
+    ORIENTATION_FACTORS,
+    FIXTURE_TYPES,
+    ROOM_ILLUMINANCE,
+    WINDOW_WALLS,
+    WINDOW_SILL_HEIGHT,
+    WINDOW_SIDE_SPREAD,
+    DAYLIGHT_ZONES,
+    WORK_PLANE_HEIGHT,
+    ILLUMINANCE_GRID_SPACING,
+    ILLUMINANCE_TOLERANCE
+)
+from .spatial_index import FixtureGrid, CELLS_PER_RADIUS
 from colour import Color
 
 def calculate_room_area(length: float, width: float) -> float:
@@ -72,6 +85,182 @@ def calculate_fixture_positions(length: float, width: float, height: float,
 
     return positions
 
+def calculate_control_zones(fixture_positions: list, length: float, width: float, height: float,
+                            orientation: str, num_windows: int, window_width: float, window_height: float,
+                            fixture_type: str) -> dict:
+    """Group fixtures into daylight and interior control zones with dimming savings."""
+    zone_names = list(DAYLIGHT_ZONES.keys())
+    xy = np.array([[pos["x"], pos["y"]] for pos in fixture_positions], dtype=float).reshape(-1, 2)
+
+    # Distance of every fixture from the window wall, and its position along that wall
+    wall = WINDOW_WALLS[orientation]
+    if wall in ("x_min", "x_max"):
+        distance = xy[:, 0] if wall == "x_min" else length - xy[:, 0]
+        along_wall, wall_length = xy[:, 1], width
+    else:
+        distance = xy[:, 1] if wall == "y_min" else width - xy[:, 1]
+        along_wall, wall_length = xy[:, 0], length
+
+    # Zone boundaries scale with the window head height
+    head_height = min(height, WINDOW_SILL_HEIGHT + window_height)
+    depths = np.array([DAYLIGHT_ZONES[name]["depth_factor"] * head_height for name in zone_names])
+
+    # Windows are spread evenly along the wall; daylight zones only reach fixtures in front of them
+    centers = wall_length * np.arange(1, num_windows + 1) / (num_windows + 1)
+    half_span = window_width / 2 + WINDOW_SIDE_SPREAD
+    spans = np.clip(np.column_stack([centers - half_span, centers + half_span]), 0, wall_length)
+    glazed_width = 0.0
+    covered_to = 0.0
+    for start, end in spans:
+        glazed_width += max(0.0, end - max(start, covered_to))
+        covered_to = max(covered_to, end)
+
+    in_front = (np.abs(along_wall[:, None] - centers[None, :]) <= half_span).any(axis=1)
+    zone_index = np.where(in_front, np.searchsorted(depths, distance, side="left"), len(zone_names) - 1)
+
+    window_area = calculate_window_area(num_windows, window_width, window_height)
+    zones = {}
+    previous_depth = 0.0
+    for index, name in enumerate(zone_names):
+        fixture_indices = np.flatnonzero(zone_index == index)
+
+        # Daylight a zone receives: its share of the window light spread over its own floor strip.
+        # Fixtures are sized without any daylight credit, so this is all available for dimming.
+        share = DAYLIGHT_ZONES[name]["daylight_share"]
+        if share > 0 and window_area > 0 and glazed_width > 0:
+            strip_area = glazed_width * (depths[index] - previous_depth)
+            zone_light = calculate_natural_light(window_area, strip_area, orientation)
+            dimming_fraction = min(1.0, share * float(zone_light))
+        else:
+            dimming_fraction = 0.0
+        previous_depth = depths[index]
+        energy_metrics = calculate_energy_metrics(fixture_type, len(fixture_indices))
+
+        zones[name] = {
+            "count": len(fixture_indices),
+            "fixture_indices": fixture_indices.tolist(),
+            "max_depth": depths[index],
+            "dimming_fraction": dimming_fraction,
+            "annual_savings_kwh": energy_metrics["annual_energy_kwh"] * dimming_fraction,
+            "annual_savings_cost": energy_metrics["annual_cost"] * dimming_fraction
+        }
+
+    return zones
+
+def calculate_cutoff_radius(mounting_height: float, tolerance: float) -> float:
+    """Plan radius beyond which fixtures add about `tolerance` of a point's illuminance.
+
+    This is an estimate for an unbounded floor of evenly spaced fixtures, not a bound: points
+    near walls and corners have fewer close fixtures and can see a few times more error.
+    """
+    if not 0 <= tolerance < 1:
+        raise ValueError("tolerance must be in [0, 1)")
+    if tolerance == 0:
+        return np.inf
+
+    # Uniformly spaced Lambertian downlights: the share of illuminance from beyond R is h^2 / (h^2 + R^2)
+    return mounting_height * np.sqrt(1 / tolerance - 1)
+
+def _illuminance_from(points: np.ndarray, fixtures: np.ndarray, intensity: float,
+                      work_plane_height: float, cutoff_radius: float = np.inf) -> np.ndarray:
+    """Sum Lambertian point-source illuminance at `points` from `fixtures`, ignoring any beyond the cutoff."""
+    offsets = points[:, None, :] - fixtures[None, :, :2]
+    plan_distance_sq = offsets[..., 0] ** 2 + offsets[..., 1] ** 2
+    mounting_height = fixtures[None, :, 2] - work_plane_height
+
+    # E = I0 * cos^2(theta) / d^2 = I0 * h^2 / d^4
+    distance_sq = plan_distance_sq + mounting_height ** 2
+    illuminance = intensity * mounting_height ** 2 / distance_sq ** 2
+    illuminance[plan_distance_sq > cutoff_radius ** 2] = 0
+    return illuminance.sum(axis=1)
+
+def calculate_point_illuminance(points, fixture_positions: list, fixture_type: str,
+                                work_plane_height: float = WORK_PLANE_HEIGHT,
+                                tolerance: float = None, cutoff_radius: float = None) -> np.ndarray:
+    """Calculate direct illuminance (lux) at work plane points, culling fixtures beyond the cutoff.
+
+    `tolerance` sets the cutoff through calculate_cutoff_radius, so it is the expected share of
+    illuminance dropped away from the walls rather than a guaranteed maximum error.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    fixture_specs = FIXTURE_TYPES[fixture_type]
+    lumens_per_fixture = fixture_specs["efficacy"] * np.mean(fixture_specs["wattage_range"])
+    intensity = lumens_per_fixture / np.pi  # Peak candela of a Lambertian downlight
+
+    fixtures = np.array([[pos["x"], pos["y"], pos["z"]] for pos in fixture_positions], dtype=float).reshape(-1, 3)
+    illuminance = np.zeros(len(points))
+    if len(fixtures) == 0:
+        return illuminance
+
+    # The highest fixture has the widest spread, so its radius bounds the tail for all of them
+    if cutoff_radius is None and tolerance is not None:
+        cutoff_radius = calculate_cutoff_radius(fixtures[:, 2].max() - work_plane_height, tolerance)
+    if cutoff_radius is not None and cutoff_radius <= 0:
+        raise ValueError("cutoff_radius must be positive")
+
+    # A cutoff reaching across the whole floor culls nothing, so sum every fixture directly
+    all_xy = np.vstack([points, fixtures[:, :2]])
+    floor_diagonal = np.hypot(*np.ptp(all_xy, axis=0))
+    if cutoff_radius is None or cutoff_radius >= floor_diagonal:
+        # Brute force, in chunks to bound the points x fixtures matrix
+        chunk = max(1, 2_000_000 // len(fixtures))
+        for start in range(0, len(points), chunk):
+            illuminance[start:start + chunk] = _illuminance_from(
+                points[start:start + chunk], fixtures, intensity, work_plane_height
+            )
+        return illuminance
+
+    grid = FixtureGrid(fixture_positions, cutoff_radius / CELLS_PER_RADIUS)
+    for cell, point_indices in grid.group_points(points):
+        nearby = grid.candidates(cell, cutoff_radius)
+        if len(nearby):
+            illuminance[point_indices] = _illuminance_from(
+                points[point_indices], fixtures[nearby], intensity, work_plane_height, cutoff_radius
+            )
+    return illuminance
+
+def calculate_illuminance_grid(length: float, width: float, fixture_positions: list, fixture_type: str,
+                               spacing: float = ILLUMINANCE_GRID_SPACING,
+                               tolerance: float = ILLUMINANCE_TOLERANCE) -> dict:
+    """Calculate the direct work plane illuminance map over the room floor."""
+    x = np.arange(spacing / 2, length, spacing)
+    y = np.arange(spacing / 2, width, spacing)
+    grid_x, grid_y = np.meshgrid(x, y)
+    points = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+    lux = calculate_point_illuminance(
+        points, fixture_positions, fixture_type, tolerance=tolerance
+    ).reshape(grid_x.shape)
+    _, fixture_distance = find_nearest_fixtures(points, fixture_positions)
+
+    return {
+        "x": x,
+        "y": y,
+        "lux": lux,
+        "average_lux": lux.mean(),
+        "minimum_lux": lux.min(),
+        "uniformity": lux.min() / lux.mean() if lux.mean() > 0 else 0.0,
+        "max_fixture_distance": fixture_distance.max()
+    }
+
+def count_illuminance_grid_pairs(length: float, width: float, num_fixtures: int,
+                                 spacing: float = ILLUMINANCE_GRID_SPACING) -> int:
+    """Point-fixture pairs the illuminance map could sum, an upper bound on how long it takes."""
+    return int(np.ceil(length / spacing) * np.ceil(width / spacing) * num_fixtures)
+
+def find_nearest_fixtures(points, fixture_positions: list, cell_size: float = None) -> tuple:
+    """Index of and plan distance to the nearest fixture for each point."""
+    if cell_size is None:
+        # Mean fixture spacing (about one fixture per cell) keeps each search to a handful of cells;
+        # only axes the fixtures actually spread along count, so a single row uses its own spacing
+        xy = np.array([[pos["x"], pos["y"]] for pos in fixture_positions], dtype=float).reshape(-1, 2)
+        extents = np.ptp(xy, axis=0) if len(xy) else np.zeros(2)
+        extents = extents[extents > 0]
+        cell_size = (extents.prod() / len(xy)) ** (1 / len(extents)) if len(extents) else 1.0
+
+    grid = FixtureGrid(fixture_positions, cell_size)
+    return grid.nearest(points)
+
 def calculate_energy_metrics(fixture_type: str, num_fixtures: int, 
                            daily_hours: float = 5) -> dict:
     """Calculate energy consumption and cost metrics."""
@@ -141,4 +330,49 @@ def calculate_required_lumens(
     # Reduce required lumens based on natural light
     artificial_lumens = base_lumens * reflectance_factor * (1 - natural_light_factor)
 
-    return max(0, artificial_lumens)
\ No newline at end of file
+    return max(0, artificial_lumens)
+
+def calculate_lighting_plan(inputs: dict) -> dict:
+    """Run the full lighting calculation for one set of room inputs."""
+    room_area = calculate_room_area(inputs["length"], inputs["width"])
+    window_area = calculate_window_area(inputs["num_windows"], inputs["window_width"], inputs["window_height"])
+    natural_light_factor = (
+        calculate_natural_light(window_area, room_area, inputs["orientation"])
+        if inputs["num_windows"] > 0 else 0
+    )
+    reflectance = calculate_average_reflectance(inputs["wall_color"], inputs["ceiling_color"])
+    # Fixtures are sized for no daylight (evenings, overcast days); the control zones dim them when it is available
+    required_lumens = calculate_required_lumens(
+        room_area,
+        ROOM_ILLUMINANCE[inputs["room_type"]],
+        reflectance,
+        0
+    )
+
+    recommendations = get_fixture_recommendations(required_lumens)
+    fixture_positions = calculate_fixture_positions(
+        inputs["length"], inputs["width"], inputs["height"],
+        inputs["preferred_fixture"],
+        required_lumens,
+        inputs["mounting_type"]
+    )
+    control_zones = calculate_control_zones(
+        fixture_positions,
+        inputs["length"], inputs["width"], inputs["height"],
+        inputs["orientation"],
+        inputs["num_windows"],
+        inputs["window_width"],
+        inputs["window_height"],
+        inputs["preferred_fixture"]
+    )
+
+    return {
+        "room_area": room_area,
+        "window_area": window_area,
+        "natural_light_factor": natural_light_factor,
+        "reflectance": reflectance,
+        "required_lumens": required_lumens,
+        "recommendations": recommendations,
+        "fixture_positions": fixture_positions,
+        "control_zones": control_zones
+    }
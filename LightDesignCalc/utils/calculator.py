@@ -1,14 +1,13 @@
+import time
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 from utils.calculations import (
-    calculate_room_area,
-    calculate_window_area,
-    calculate_natural_light,
-    calculate_average_reflectance,
-    calculate_required_lumens,
-    get_fixture_recommendations,
-    calculate_fixture_positions
+    calculate_lighting_plan,
+    calculate_illuminance_grid,
+    count_illuminance_grid_pairs
 )
 from utils.constants import (
     ROOM_ILLUMINANCE,
@@ -16,8 +15,61 @@ from utils.constants import (
     MOUNTING_OPTIONS,
     INR_TO_USD
 )
-from utils.visualization import create_room_visualization
+from utils.visualization import create_room_visualization, create_illuminance_map
 from utils.report import create_pdf_report
+from utils.compute_pool import ComputePool, PoolBusyError, POOL_MIN_PAIRS
+
+FIRST_WAIT = 0.05  # seconds to wait for a pool job before drawing a progress bar
+
+@st.cache_resource
+def _get_compute_pool():
+    """Process pool shared by every session; cached so script reloads keep the same workers."""
+    return ComputePool()
+
+def _run_in_pool(job_name, job_key, fn, *args, heavy=True):
+    """Run a stage on the shared compute pool when heavy, showing progress if it takes a while."""
+    jobs = st.session_state.setdefault("compute_jobs", {})
+    job = jobs.get(job_name)
+
+    # Inputs changed since submission: cancel the stale job (a running one is left to finish and ignored)
+    if job is not None and job["key"] != job_key:
+        job["future"].cancel()
+        del jobs[job_name]
+        job = None
+
+    # Light work costs less than the pool round trip
+    if not heavy:
+        return fn(*args)
+
+    if job is None:
+        try:
+            future = _get_compute_pool().submit(fn, *args)
+        except PoolBusyError as e:
+            st.warning(str(e))
+            st.stop()
+        job = jobs[job_name] = {"key": job_key, "future": future, "started": time.time()}
+
+    future = job["future"]
+    done, _ = wait([future], timeout=FIRST_WAIT)
+    if not done:
+        # Widget changes interrupt this loop with a rerun, which cancels the job above
+        progress = st.progress(0.0)
+        while not future.done():
+            elapsed = time.time() - job["started"]
+            status = "Calculating" if future.running() else "Waiting for a free worker"
+            progress.progress(min(0.95, elapsed / (elapsed + 1.0)), text=f"{status}... {elapsed:.1f}s")
+            time.sleep(0.1)
+        progress.empty()
+
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # A worker died mid-job; the pool is rebuilt on the next submit, so finish this one here
+        del jobs[job_name]
+        return fn(*args)
+    except Exception:
+        del jobs[job_name]
+        raise
 
 def show():
     st.title("Interior Lighting Estimator")
@@ -62,25 +114,29 @@ def show():
             orientation = "North"
 
     # Calculations
-    room_area = calculate_room_area(length, width)
-    window_area = calculate_window_area(num_windows, window_width, window_height)
-    natural_light_factor = calculate_natural_light(window_area, room_area, orientation) if num_windows > 0 else 0
-    reflectance = calculate_average_reflectance(wall_color, ceiling_color)
-    required_lumens = calculate_required_lumens(
-        room_area,
-        ROOM_ILLUMINANCE[room_type],
-        reflectance,
-        natural_light_factor
-    )
-
-    # Get recommendations and calculate fixture positions
-    recommendations = get_fixture_recommendations(required_lumens)
-    fixture_positions = calculate_fixture_positions(
-        length, width, height,
-        preferred_fixture,
-        required_lumens,
-        mounting_type
-    )
+    inputs = {
+        "length": length,
+        "width": width,
+        "height": height,
+        "room_type": room_type,
+        "wall_color": wall_color,
+        "ceiling_color": ceiling_color,
+        "preferred_fixture": preferred_fixture,
+        "mounting_type": mounting_type,
+        "num_windows": num_windows,
+        "window_width": window_width,
+        "window_height": window_height,
+        "orientation": orientation
+    }
+    plan = calculate_lighting_plan(inputs)
+
+    room_area = plan["room_area"]
+    natural_light_factor = plan["natural_light_factor"]
+    reflectance = plan["reflectance"]
+    required_lumens = plan["required_lumens"]
+    recommendations = plan["recommendations"]
+    fixture_positions = plan["fixture_positions"]
+    control_zones = plan["control_zones"]
 
     with col2:
         # Display room visualization
@@ -94,6 +150,23 @@ def show():
         )
         st.plotly_chart(fig, use_container_width=True)
 
+        # Illuminance map (large rooms run on the shared compute pool)
+        st.subheader("Work Plane Illuminance")
+        illuminance_grid = _run_in_pool(
+            "illuminance_map", inputs,
+            calculate_illuminance_grid, length, width, fixture_positions, preferred_fixture,
+            heavy=count_illuminance_grid_pairs(length, width, len(fixture_positions)) >= POOL_MIN_PAIRS
+        )
+        st.plotly_chart(
+            create_illuminance_map(illuminance_grid, ROOM_ILLUMINANCE[room_type]),
+            use_container_width=True
+        )
+        map_col1, map_col2, map_col3, map_col4 = st.columns(4)
+        map_col1.metric("Average Direct Illuminance", f"{illuminance_grid['average_lux']:.0f} lux")
+        map_col2.metric("Minimum Direct Illuminance", f"{illuminance_grid['minimum_lux']:.0f} lux")
+        map_col3.metric("Uniformity (min/avg)", f"{illuminance_grid['uniformity']:.2f}")
+        map_col4.metric("Farthest Point from a Fixture", f"{illuminance_grid['max_fixture_distance']:.1f} m")
+
         # Display calculations
         st.subheader("Room Analysis")
         metrics_col1, metrics_col2 = st.columns(2)
@@ -125,6 +198,21 @@ def show():
 
         st.table(efficiency_data)
 
+        # Display daylight control zones
+        st.subheader("Daylight Control Zones")
+        zone_data = []
+        for zone_name, zone in control_zones.items():
+            zone_data.append({
+                "Zone": zone_name,
+                "Fixtures": zone['count'],
+                "Depth from Window (m)": "-" if np.isinf(zone['max_depth']) else f"{zone['max_depth']:.1f}",
+                "Dimming Potential": f"{zone['dimming_fraction']*100:.0f}%",
+                "Annual Savings (kWh)": f"{zone['annual_savings_kwh']:.1f}",
+                "Annual Savings (₹)": f"₹{zone['annual_savings_cost']:,.2f}"
+            })
+
+        st.table(zone_data)
+
         # Generate PDF Report
         if st.button("Download Detailed Report"):
             room_data = {
@@ -0,0 +1,62 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Pool sizing (shared by every Streamlit session in this server process)
+MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+MAX_PENDING_JOBS = MAX_WORKERS * 2  # running + queued jobs before submit blocks
+SUBMIT_TIMEOUT = 2.0  # seconds to wait for a free slot before giving up
+
+# Illuminance maps with fewer point-fixture pairs finish (~37 ns per pair) before a pool
+# round trip would pay off, so they run inline
+POOL_MIN_PAIRS = 500_000  # about 20 ms
+
+class PoolBusyError(RuntimeError):
+    """Raised when the compute pool queue stays full for the whole submit timeout."""
+
+class ComputePool:
+    """Process pool with a bounded number of pending jobs."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS, max_pending: int = MAX_PENDING_JOBS):
+        self._max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor_lock = threading.Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self):
+        # Spawn workers so they never inherit the server's threads and locks
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _submit_to_executor(self, fn, *args):
+        with self._executor_lock:
+            try:
+                return self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died and the executor refuses new work; replace it and retry once
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+                return self._executor.submit(fn, *args)
+
+    def submit(self, fn, *args, timeout: float = SUBMIT_TIMEOUT):
+        """Submit a job, waiting up to `timeout` seconds for a free queue slot."""
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolBusyError("Compute pool is busy, try again shortly.")
+
+        try:
+            future = self._submit_to_executor(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        # Cancelled, failed and finished jobs all hand their slot back
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self):
+        with self._executor_lock:
+            self._executor.shutdown(wait=False, cancel_futures=True)
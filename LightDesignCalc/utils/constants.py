@@ -23,6 +23,30 @@ ORIENTATION_FACTORS = {
     "West": 0.85,
 }
 
+# Wall each window orientation is assumed to sit on (room origin at the south-west corner,
+# length along the x axis pointing east, width along the y axis pointing north)
+WINDOW_WALLS = {
+    "North": "y_max",
+    "South": "y_min",
+    "East": "x_max",
+    "West": "x_min",
+}
+
+# Daylight control zones: depth from the window wall as a multiple of the window head height,
+# and the share of the light entering through the windows that lands in the zone
+WINDOW_SILL_HEIGHT = 0.9  # meters
+WINDOW_SIDE_SPREAD = 0.6  # meters a daylight zone extends past each side of a window
+DAYLIGHT_ZONES = {
+    "Primary Daylight": {"depth_factor": 1.0, "daylight_share": 2 / 3},
+    "Secondary Daylight": {"depth_factor": 2.0, "daylight_share": 1 / 3},
+    "Interior": {"depth_factor": float("inf"), "daylight_share": 0.0},
+}
+
+# Height of the horizontal work plane illuminance is evaluated on
+WORK_PLANE_HEIGHT = 0.75  # meters
+ILLUMINANCE_GRID_SPACING = 0.1  # meters between illuminance map points
+ILLUMINANCE_TOLERANCE = 1e-2  # share of illuminance the map may drop by skipping distant fixtures
+
 # Mounting options for different fixtures
 MOUNTING_OPTIONS = {
     "LED Bulb": ["Ceiling Mounted", "Wall Mounted", "Pendant"],
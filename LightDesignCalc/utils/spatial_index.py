@@ -0,0 +1,110 @@
+import numpy as np
+
+# Cells per cutoff radius for culling queries; finer cells trim the searched area
+# from 9 R² (3 x 3 cells of size R) towards the pi R² that matters
+CELLS_PER_RADIUS = 4
+
+class FixtureGrid:
+    """Uniform hash grid over fixture plan positions for cutoff and nearest-fixture queries."""
+
+    def __init__(self, fixture_positions: list, cell_size: float):
+        if not 0 < cell_size < np.inf:
+            raise ValueError("cell_size must be positive and finite")
+
+        self.positions = np.array(
+            [[pos["x"], pos["y"], pos["z"]] for pos in fixture_positions], dtype=float
+        ).reshape(-1, 3)
+        self.cell_size = cell_size
+
+        # Bucket fixture indices by the (column, row) of the cell they fall in
+        cells = np.floor(self.positions[:, :2] / cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        unique_cells, starts, counts = np.unique(
+            cells[order], axis=0, return_index=True, return_counts=True
+        )
+        self._buckets = {
+            (int(cx), int(cy)): order[start:start + count]
+            for (cx, cy), start, count in zip(unique_cells, starts, counts)
+        }
+        self._bucket_cells = unique_cells.reshape(-1, 2)
+        self._bucket_indices = list(self._buckets.values())
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _cell_of(self, points: np.ndarray) -> np.ndarray:
+        return np.floor(points / self.cell_size).astype(np.int64)
+
+    def _gather(self, cell: tuple, offsets) -> np.ndarray:
+        cx, cy = cell
+        found = [
+            self._buckets[(cx + dx, cy + dy)]
+            for dx, dy in offsets
+            if (cx + dx, cy + dy) in self._buckets
+        ]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def _ring(self, cell: tuple, reach: int) -> np.ndarray:
+        """Indices of fixtures in the square of cells `reach` cells around `cell`."""
+        if (2 * reach + 1) ** 2 > len(self._bucket_cells):
+            # Wide squares: filter the occupied cells instead of probing every empty one
+            inside = (np.abs(self._bucket_cells - np.array(cell)) <= reach).all(axis=1)
+            found = [self._bucket_indices[i] for i in np.flatnonzero(inside)]
+            return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+        return self._gather(cell, (
+            (dx, dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)
+        ))
+
+    def group_points(self, points: np.ndarray):
+        """Yield (cell, point indices) for every grid cell that contains query points."""
+        cells = self._cell_of(points)
+        unique_cells, inverse = np.unique(cells, axis=0, return_inverse=True)
+        order = np.argsort(inverse.ravel(), kind="stable")
+        bounds = np.cumsum(np.bincount(inverse.ravel(), minlength=len(unique_cells)))
+        start = 0
+        for (cx, cy), end in zip(unique_cells, bounds):
+            yield (int(cx), int(cy)), order[start:end]
+            start = end
+
+    def candidates(self, cell: tuple, radius: float) -> np.ndarray:
+        """Indices of fixtures that may lie within `radius` of any point in `cell`."""
+        reach = int(np.ceil(radius / self.cell_size))
+        # Skip the corner cells of the square that lie wholly outside the radius
+        offsets = np.arange(-reach, reach + 1)
+        gap = np.maximum(np.abs(offsets) - 1, 0) * self.cell_size
+        dx, dy = np.nonzero(gap[:, None] ** 2 + gap[None, :] ** 2 <= radius ** 2)
+        return self._gather(cell, zip(offsets[dx].tolist(), offsets[dy].tolist()))
+
+    def nearest(self, points: np.ndarray) -> tuple:
+        """Index of and plan distance to the nearest fixture for each point."""
+        if len(self) == 0:
+            raise ValueError("FixtureGrid has no fixtures to search")
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        nearest_index = np.empty(len(points), dtype=np.int64)
+        nearest_distance = np.empty(len(points))
+        occupied_min = self._bucket_cells.min(axis=0)
+        occupied_max = self._bucket_cells.max(axis=0)
+
+        for cell, point_indices in self.group_points(points):
+            # Start at the first square that reaches any occupied cell, then grow it
+            # until the best match is closer than its edge
+            reach = int(np.maximum(np.maximum(occupied_min - cell, np.array(cell) - occupied_max), 0).max())
+            while True:
+                indices = self._ring(cell, reach)
+                if len(indices):
+                    offsets = points[point_indices, None, :] - self.positions[None, indices, :2]
+                    distance = np.hypot(offsets[..., 0], offsets[..., 1])
+                    best = np.argmin(distance, axis=1)
+                    best_distance = distance[np.arange(len(point_indices)), best]
+                    if best_distance.max() <= reach * self.cell_size:
+                        break
+                    reach = max(reach + 1, int(np.ceil(best_distance.max() / self.cell_size)))
+                else:
+                    reach += 1
+
+            nearest_index[point_indices] = indices[best]
+            nearest_distance[point_indices] = best_distance
+
+        return nearest_index, nearest_distance
@@ -148,3 +148,23 @@ def create_room_visualization(length, width, height, fixture_positions=None,
     )
 
     return fig
+
+def create_illuminance_map(illuminance_grid, required_illuminance):
+    """Create a heatmap of the work plane illuminance."""
+    fig = go.Figure(go.Heatmap(
+        x=illuminance_grid["x"],
+        y=illuminance_grid["y"],
+        z=illuminance_grid["lux"],
+        colorscale="YlOrRd",
+        zmin=0,
+        zmax=max(required_illuminance, float(illuminance_grid["lux"].max())),
+        colorbar=dict(title="lux")
+    ))
+
+    fig.update_layout(
+        xaxis=dict(title="Length (m)"),
+        yaxis=dict(title="Width (m)", scaleanchor="x"),
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+
+    return fig